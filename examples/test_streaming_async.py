@@ -50,6 +50,7 @@ class CreateRunEventStream(AsyncEventStream[AssistantStreamEvent]):
         yield ThreadRunCreated(event="thread.run.created", data=self.created_run)
 
         self.created_run.status = "in_progress"
+        # put the run back after each mutation so stale cached dumps are evicted
         self.state_store.beta.threads.runs.put(self.created_run)
         yield ThreadRunInProgress(event="thread.run.in_progress", data=self.created_run)
 
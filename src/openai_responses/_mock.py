@@ -1,8 +1,12 @@
 import inspect
+import re
 from functools import wraps
-from typing import Any, Callable, Optional
+from typing import Any, Callable, ClassVar, Dict, Optional, Tuple
 
 import respx
+from respx.patterns import Pattern
+from respx.router import MockRouter
+from respx.types import URLPatternTypes
 
 from ._routes import (
     BetaRoutes,
@@ -16,6 +20,64 @@ from ._routes import (
 from .stores import StateStore
 
 
+class _Router(MockRouter):
+    """MockRouter that reuses built route patterns across instances
+
+    Every decorated test constructs a fresh mock and with it the full set of
+    routes. Stock respx re-parses the pattern lookups, merges in the base URL
+    and scans existing routes for a duplicate pattern on every mount. The
+    mounted patterns here are static, so the merged pattern is cached per
+    (base URL, method, regex) and appended directly on reuse.
+    """
+
+    _pattern_cache: ClassVar[Dict[Tuple[Optional[str], str, str], Pattern]] = {}
+
+    def __init__(
+        self,
+        *,
+        assert_all_called: bool = True,
+        base_url: Optional[str] = None,
+    ) -> None:
+        super().__init__(assert_all_called=assert_all_called, base_url=base_url)
+        self._base_url = base_url
+        self._route_index: Dict[Tuple[Optional[str], str, str], respx.Route] = {}
+
+    def request(
+        self,
+        method: str,
+        url: Optional[URLPatternTypes] = None,
+        *,
+        name: Optional[str] = None,
+        **lookups: Any,
+    ) -> respx.Route:
+        regex = lookups.get("url__regex")
+        if (
+            url is None
+            and name is None
+            and len(lookups) == 1
+            and isinstance(regex, re.Pattern)
+        ):
+            key = (self._base_url, method, regex.pattern)
+            existing = self._route_index.get(key)
+            if existing is not None:
+                # mirror RouteList.add: re-registering the same pattern
+                # reuses the mounted route with its mock reset
+                existing.return_value = None
+                existing.side_effect = None
+                existing.pass_through(False)
+                return existing
+            pattern = self._pattern_cache.get(key)
+            if pattern is None:
+                route = super().request(method, url__regex=regex)
+                self._pattern_cache[key] = route.pattern
+            else:
+                route = respx.Route(pattern)
+                self.routes._routes.append(route)  # type: ignore[attr-defined]
+            self._route_index[key] = route
+            return route
+        return super().request(method, url, name=name, **lookups)
+
+
 class OpenAIMock:
     beta: BetaRoutes
     chat: ChatRoutes
@@ -29,7 +91,7 @@ class OpenAIMock:
         base_url: Optional[str] = None,
         state: Optional[StateStore] = None,
     ) -> None:
-        self._router = respx.mock(
+        self._router = _Router(
             assert_all_called=False,
             base_url=base_url or "https://api.openai.com/v1",
         )
@@ -1,5 +1,4 @@
 from abc import ABC, abstractmethod
-from functools import partial
 import inspect
 from typing import Any, Callable, Generic, Union
 from typing_extensions import override
@@ -11,12 +10,15 @@ from openai import BaseModel
 
 from ..stores import StateStore
 from .._types.generics import M, P
+from .._utils.response import json_response
 from .._utils.serde import model_dict
 
 __all__ = ["StatelessRoute", "StatefulRoute"]
 
 
 class Route(ABC, Generic[M, P]):
+    __slots__ = ("_route", "_status_code", "_response")
+
     def __init__(
         self,
         route: respx.Route,
@@ -53,24 +55,28 @@ class Route(ABC, Generic[M, P]):
 
     @property
     def _side_effect(self) -> Callable[..., httpx.Response]:
-        if callable(self._response):
-            return self._response
-
-        def _handler(request: httpx.Request, route: respx.Route, **kwargs: Any):
-            if isinstance(self._response, BaseModel):
-                return httpx.Response(
-                    status_code=self._status_code,
-                    json=model_dict(self._response),
-                )
+        response = self._response
+        if callable(response):
+            return response
+
+        # NOTE: dispatch on the response type once here instead of on every
+        # request, since assigning `response` rebuilds the side effect anyway
+        if isinstance(response, BaseModel):
+
+            def _handler(request: httpx.Request, route: respx.Route, **kwargs: Any):
+                return json_response(self._status_code, model_dict(response))
+
+        elif isinstance(response, httpx.Response):
 
-            elif isinstance(self._response, httpx.Response):
-                return self._response
+            def _handler(request: httpx.Request, route: respx.Route, **kwargs: Any):
+                return response
 
-            else:
-                assert not callable(self._response)
-                return httpx.Response(
-                    status_code=self._status_code,
-                    json=model_dict(self._build(self._response, request), by_alias=True),
+        else:
+
+            def _handler(request: httpx.Request, route: respx.Route, **kwargs: Any):
+                return json_response(
+                    self._status_code,
+                    model_dict(self._build(response, request), by_alias=True),
                 )
 
         return _handler
@@ -113,11 +119,15 @@ class Route(ABC, Generic[M, P]):
 
 
 class StatelessRoute(Route[M, P]):
+    __slots__ = ()
+
     def __init__(self, *, route: respx.Route, status_code: int) -> None:
         super().__init__(route, status_code)
 
 
 class StatefulRoute(Route[M, P]):
+    __slots__ = ("_state",)
+
     def __init__(
         self,
         *,
@@ -131,36 +141,54 @@ class StatefulRoute(Route[M, P]):
     @property
     @override
     def _side_effect(self) -> Callable[..., httpx.Response]:
-        if callable(self._response):
-            argspec = inspect.getfullargspec(self._response)
+        response = self._response
+        if callable(response):
+            argspec = inspect.getfullargspec(response)
             needs_store = (
                 "state_store" in argspec.args or "state_store" in argspec.kwonlyargs
             )
-            if needs_store:
-                return partial(self._response, state_store=self._state)
-            else:
-                return self._response
-
-        def _handler(request: httpx.Request, route: respx.Route, **kwargs: Any):
-            if isinstance(self._response, BaseModel):
-                self._state._blind_put(self._response)
-                return httpx.Response(
-                    status_code=self._status_code,
-                    json=model_dict(self._response),
-                )
+            if not needs_store:
+                return response
+
+            state = self._state
+            wants_route = "route" in argspec.args or "route" in argspec.kwonlyargs
+            if wants_route:
+
+                def _effect_with_route(
+                    request: httpx.Request,
+                    route: respx.Route,
+                    **kwargs: Any,
+                ) -> httpx.Response:
+                    return response(request, route=route, state_store=state, **kwargs)
+
+                return _effect_with_route
+
+            def _effect(
+                request: httpx.Request,
+                **kwargs: Any,
+            ) -> httpx.Response:
+                return response(request, state_store=state, **kwargs)
+
+            return _effect
+
+        if isinstance(response, BaseModel):
+
+            def _handler(request: httpx.Request, route: respx.Route, **kwargs: Any):
+                self._state._blind_put(response)
+                return json_response(self._status_code, model_dict(response))
+
+        elif isinstance(response, httpx.Response):
+
+            def _handler(request: httpx.Request, route: respx.Route, **kwargs: Any):
+                return response
 
-            elif isinstance(self._response, httpx.Response):
-                return self._response
+        else:
 
-            else:
-                assert not callable(self._response)
+            def _handler(request: httpx.Request, route: respx.Route, **kwargs: Any):
                 try:
-                    model = self._build(self._response, request)
+                    model = self._build(response, request)
                     self._state._blind_put(model)
-                    return httpx.Response(
-                        status_code=self._status_code,
-                        json=model_dict(model),
-                    )
+                    return json_response(self._status_code, model_dict(model))
                 except NotImplementedError:
                     import warnings
 
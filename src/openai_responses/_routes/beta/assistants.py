@@ -23,7 +23,9 @@ from ..._types.partials.deleted import PartialResourceDeleted
 from ..._types.partials.sync_cursor_page import PartialSyncCursorPage
 from ..._types.partials.assistants import PartialAssistant
 
+from ..._utils.response import NOT_FOUND, json_response
 from ..._utils.faker import faker
+from ..._utils.regex import compile_regex
 from ..._utils.serde import json_loads, model_dict, model_parse
 from ..._utils.time import utcnow_unix_timestamp_s
 
@@ -37,9 +39,11 @@ __all__ = [
 
 
 class AssistantCreateRoute(StatefulRoute[Assistant, PartialAssistant]):
+    __slots__ = ()
+
     def __init__(self, router: respx.MockRouter, state: StateStore) -> None:
         super().__init__(
-            route=router.post(url__regex="/assistants"),
+            route=router.post(url__regex=compile_regex("/assistants")),
             status_code=201,
             state=state,
         )
@@ -66,7 +70,7 @@ class AssistantCreateRoute(StatefulRoute[Assistant, PartialAssistant]):
                         for file_id in vector_store_create_params.get("file_ids", []):
                             found_file = self._state.files.get(file_id)
                             if not found_file:
-                                return httpx.Response(404)
+                                return NOT_FOUND
                             encoded = json.dumps({"file_id": found_file.id})
                             create_file_req = httpx.Request("", "", content=encoded)
                             vector_store_file = vector_store_file_from_create_request(
@@ -107,9 +111,11 @@ class AssistantCreateRoute(StatefulRoute[Assistant, PartialAssistant]):
 class AssistantListRoute(
     StatefulRoute[SyncCursorPage[Assistant], PartialSyncCursorPage[PartialAssistant]]
 ):
+    __slots__ = ()
+
     def __init__(self, router: respx.MockRouter, state: StateStore) -> None:
         super().__init__(
-            route=router.get(url__regex="/assistants"),
+            route=router.get(url__regex=compile_regex("/assistants")),
             status_code=200,
             state=state,
         )
@@ -146,10 +152,14 @@ class AssistantListRoute(
 
 
 class AssistantRetrieveRoute(StatefulRoute[Assistant, PartialAssistant]):
+    __slots__ = ()
+
     def __init__(self, router: respx.MockRouter, state: StateStore) -> None:
         super().__init__(
             route=router.get(
-                url__regex=r"/assistants/(?P<assistant_id>[a-zA-Z0-9\_]+)"
+                url__regex=compile_regex(
+                    r"/assistants/(?P<assistant_id>[a-zA-Z0-9\_]+)"
+                )
             ),
             status_code=200,
             state=state,
@@ -166,7 +176,7 @@ class AssistantRetrieveRoute(StatefulRoute[Assistant, PartialAssistant]):
         assistant_id = kwargs["assistant_id"]
         found = self._state.beta.assistants.get(assistant_id)
         if not found:
-            return httpx.Response(404)
+            return NOT_FOUND
 
         return httpx.Response(status_code=200, json=model_dict(found))
 
@@ -176,10 +186,14 @@ class AssistantRetrieveRoute(StatefulRoute[Assistant, PartialAssistant]):
 
 
 class AssistantUpdateRoute(StatefulRoute[Assistant, PartialAssistant]):
+    __slots__ = ()
+
     def __init__(self, router: respx.MockRouter, state: StateStore) -> None:
         super().__init__(
             route=router.post(
-                url__regex=r"/assistants/(?P<assistant_id>[a-zA-Z0-9\_]+)"
+                url__regex=compile_regex(
+                    r"/assistants/(?P<assistant_id>[a-zA-Z0-9\_]+)"
+                )
             ),
             status_code=200,
             state=state,
@@ -196,7 +210,7 @@ class AssistantUpdateRoute(StatefulRoute[Assistant, PartialAssistant]):
         assistant_id = kwargs["assistant_id"]
         found = self._state.beta.assistants.get(assistant_id)
         if not found:
-            return httpx.Response(404)
+            return NOT_FOUND
 
         content: AssistantUpdateParams = json_loads(request.content)
         deserialized = model_dict(found)
@@ -215,10 +229,14 @@ class AssistantDeleteRoute(
         AssistantDeleted, PartialResourceDeleted[Literal["assistant.deleted"]]
     ]
 ):
+    __slots__ = ()
+
     def __init__(self, router: respx.MockRouter, state: StateStore) -> None:
         super().__init__(
             route=router.delete(
-                url__regex=r"/assistants/(?P<assistant_id>[a-zA-Z0-9\_]+)"
+                url__regex=compile_regex(
+                    r"/assistants/(?P<assistant_id>[a-zA-Z0-9\_]+)"
+                )
             ),
             status_code=200,
             state=state,
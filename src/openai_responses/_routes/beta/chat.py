@@ -10,6 +10,7 @@ from .._base import StatelessRoute
 from ..._types.partials.chat import PartialParsedChatCompletion
 
 from ..._utils.faker import faker
+from ..._utils.regex import compile_regex
 from ..._utils.serde import json_loads, model_parse
 from ..._utils.time import utcnow_unix_timestamp_s
 
@@ -19,9 +20,11 @@ __all__ = ["ParsedChatCompletionsCreateRoute"]
 class ParsedChatCompletionsCreateRoute(
     StatelessRoute[ParsedChatCompletion[Dict[str, Any]], PartialParsedChatCompletion]
 ):
+    __slots__ = ()
+
     def __init__(self, router: respx.MockRouter) -> None:
         super().__init__(
-            route=router.post(url__regex="/chat/completions"),
+            route=router.post(url__regex=compile_regex("/chat/completions")),
             status_code=201,
         )
 
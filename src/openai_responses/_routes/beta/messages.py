@@ -16,7 +16,15 @@ from ..._types.partials.sync_cursor_page import PartialSyncCursorPage
 from ..._types.partials.messages import PartialMessage, PartialMessageDeleted
 
 from ..._utils.faker import faker
-from ..._utils.serde import json_loads, model_dict, model_parse
+from ..._utils.regex import compile_regex
+from ..._utils.response import NOT_FOUND, json_response
+from ..._utils.serde import (
+    cached_model_dict,
+    json_loads,
+    model_construct,
+    model_dict,
+    model_parse,
+)
 from ..._utils.time import utcnow_unix_timestamp_s
 
 __all__ = [
@@ -27,12 +35,18 @@ __all__ = [
     "MessageDeleteRoute",
 ]
 
+_MessagePage = SyncCursorPage[Message]
+
 
 class MessageCreateRoute(StatefulRoute[Message, PartialMessage]):
+    __slots__ = ()
+
     def __init__(self, router: respx.MockRouter, state: StateStore) -> None:
         super().__init__(
             route=router.post(
-                url__regex=r"/threads/(?P<thread_id>[a-zA-Z0-9\_]+)/messages"
+                url__regex=compile_regex(
+                    r"/threads/(?P<thread_id>[a-zA-Z0-9\_]+)/messages"
+                )
             ),
             status_code=201,
             state=state,
@@ -50,14 +64,11 @@ class MessageCreateRoute(StatefulRoute[Message, PartialMessage]):
         thread_id = kwargs["thread_id"]
         found = self._state.beta.threads.get(thread_id)
         if not found:
-            return httpx.Response(404)
+            return NOT_FOUND
 
         model = self._build({"thread_id": thread_id}, request)
         self._state.beta.threads.messages.put(model)
-        return httpx.Response(
-            status_code=self._status_code,
-            json=model_dict(model),
-        )
+        return json_response(self._status_code, model_dict(model))
 
     @staticmethod
     def _build(partial: PartialMessage, request: httpx.Request) -> Message:
@@ -73,24 +84,24 @@ class MessageCreateRoute(StatefulRoute[Message, PartialMessage]):
         if content.get("content"):
             value = content.get("content")
             if isinstance(value, str):
-                defaults["content"].append(
+                defaults["content"] = [
                     {
                         "type": "text",
                         "text": {"annotations": [], "value": value},
                     }
-                )
+                ]
             else:
-                for block in value:
-                    if block.get("type") == "text":
-                        defaults["content"].append(
-                            {
-                                "type": "text",
-                                "text": {
-                                    "annotations": [],
-                                    "value": block.get("text"),
-                                },
-                            }
-                        )
+                defaults["content"] = [
+                    {
+                        "type": "text",
+                        "text": {
+                            "annotations": [],
+                            "value": block.get("text"),
+                        },
+                    }
+                    for block in value
+                    if block.get("type") == "text"
+                ]
 
             del content["content"]
 
@@ -100,10 +111,14 @@ class MessageCreateRoute(StatefulRoute[Message, PartialMessage]):
 class MessageListRoute(
     StatefulRoute[SyncCursorPage[Message], PartialSyncCursorPage[PartialMessage]]
 ):
+    __slots__ = ()
+
     def __init__(self, router: respx.MockRouter, state: StateStore) -> None:
         super().__init__(
             route=router.get(
-                url__regex=r"/threads/(?P<thread_id>[a-zA-Z0-9\_]+)/messages"
+                url__regex=compile_regex(
+                    r"/threads/(?P<thread_id>[a-zA-Z0-9\_]+)/messages"
+                )
             ),
             status_code=200,
             state=state,
@@ -121,7 +136,7 @@ class MessageListRoute(
         thread_id = kwargs["thread_id"]
         found = self._state.beta.threads.get(thread_id)
         if not found:
-            return httpx.Response(404)
+            return NOT_FOUND
 
         limit = request.url.params.get("limit")
         order = request.url.params.get("order")
@@ -143,10 +158,10 @@ class MessageListRoute(
         has_more = total_count != result_count
         first_id = data[0].id if has_data else None
         last_id = data[-1].id if has_data else None
-        model = SyncCursorPage[Message](data=data)
-        return httpx.Response(
-            status_code=200,
-            json=model_dict(model)
+        model = model_construct(_MessagePage, data=data)
+        return json_response(
+            200,
+            model_dict(model)
             | {"first_id": first_id, "last_id": last_id, "has_more": has_more},
         )
 
@@ -159,10 +174,14 @@ class MessageListRoute(
 
 
 class MessageRetrieveRoute(StatefulRoute[Message, PartialMessage]):
+    __slots__ = ()
+
     def __init__(self, router: respx.MockRouter, state: StateStore) -> None:
         super().__init__(
             route=router.get(
-                url__regex=r"/threads/(?P<thread_id>[a-zA-Z0-9\_]+)/messages/(?P<message_id>[a-zA-Z0-9\_]+)"
+                url__regex=compile_regex(
+                    r"/threads/(?P<thread_id>[a-zA-Z0-9\_]+)/messages/(?P<message_id>[a-zA-Z0-9\_]+)"
+                )
             ),
             status_code=200,
             state=state,
@@ -180,14 +199,14 @@ class MessageRetrieveRoute(StatefulRoute[Message, PartialMessage]):
         thread_id = kwargs["thread_id"]
         found_thread = self._state.beta.threads.get(thread_id)
         if not found_thread:
-            return httpx.Response(404)
+            return NOT_FOUND
 
         message_id = kwargs["message_id"]
         found_message = self._state.beta.threads.messages.get(message_id)
         if not found_message:
-            return httpx.Response(404)
+            return NOT_FOUND
 
-        return httpx.Response(status_code=200, json=model_dict(found_message))
+        return json_response(200, cached_model_dict(found_message))
 
     @staticmethod
     def _build(partial: PartialMessage, request: httpx.Request) -> Message:
@@ -195,10 +214,14 @@ class MessageRetrieveRoute(StatefulRoute[Message, PartialMessage]):
 
 
 class MessageUpdateRoute(StatefulRoute[Message, PartialMessage]):
+    __slots__ = ()
+
     def __init__(self, router: respx.MockRouter, state: StateStore) -> None:
         super().__init__(
             route=router.post(
-                url__regex=r"/threads/(?P<thread_id>[a-zA-Z0-9\_]+)/messages/(?P<message_id>[a-zA-Z0-9\_]+)"
+                url__regex=compile_regex(
+                    r"/threads/(?P<thread_id>[a-zA-Z0-9\_]+)/messages/(?P<message_id>[a-zA-Z0-9\_]+)"
+                )
             ),
             status_code=200,
             state=state,
@@ -216,19 +239,19 @@ class MessageUpdateRoute(StatefulRoute[Message, PartialMessage]):
         thread_id = kwargs["thread_id"]
         found_thread = self._state.beta.threads.get(thread_id)
         if not found_thread:
-            return httpx.Response(404)
+            return NOT_FOUND
 
         message_id = kwargs["message_id"]
         found_message = self._state.beta.threads.messages.get(message_id)
         if not found_message:
-            return httpx.Response(404)
+            return NOT_FOUND
 
         content: MessageUpdateParams = json_loads(request.content)
         deserialized = model_dict(found_message)
         updated = model_parse(Message, deserialized | content)
         self._state.beta.threads.messages.put(updated)
 
-        return httpx.Response(status_code=200, json=model_dict(updated))
+        return json_response(200, model_dict(updated))
 
     @staticmethod
     def _build(partial: PartialMessage, request: httpx.Request) -> Message:
@@ -236,10 +259,14 @@ class MessageUpdateRoute(StatefulRoute[Message, PartialMessage]):
 
 
 class MessageDeleteRoute(StatefulRoute[MessageDeleted, PartialMessageDeleted]):
+    __slots__ = ()
+
     def __init__(self, router: respx.MockRouter, state: StateStore) -> None:
         super().__init__(
             route=router.delete(
-                url__regex=r"/threads/(?P<thread_id>[a-zA-Z0-9\_]+)/messages/(?P<message_id>[a-zA-Z0-9\_]+)"
+                url__regex=compile_regex(
+                    r"/threads/(?P<thread_id>[a-zA-Z0-9\_]+)/messages/(?P<message_id>[a-zA-Z0-9\_]+)"
+                )
             ),
             status_code=200,
             state=state,
@@ -257,13 +284,13 @@ class MessageDeleteRoute(StatefulRoute[MessageDeleted, PartialMessageDeleted]):
         thread_id = kwargs["thread_id"]
         found_thread = self._state.beta.threads.get(thread_id)
         if not found_thread:
-            return httpx.Response(404)
+            return NOT_FOUND
 
         message_id = kwargs["message_id"]
         deleted = self._state.beta.threads.messages.delete(message_id)
-        return httpx.Response(
-            status_code=200,
-            json=model_dict(
+        return json_response(
+            200,
+            model_dict(
                 MessageDeleted(
                     id=message_id, deleted=deleted, object="thread.message.deleted"
                 )
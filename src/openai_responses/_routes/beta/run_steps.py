@@ -13,19 +13,24 @@ from ...stores import StateStore
 from ..._types.partials.run_steps import PartialRunStep
 from ..._types.partials.sync_cursor_page import PartialSyncCursorPage
 
+from ..._utils.response import NOT_FOUND, json_response
+from ..._utils.regex import compile_regex
 from ..._utils.serde import model_dict
 
-
 __all__ = ["RunStepListRoute", "RunStepRetrieveRoute"]
 
 
 class RunStepListRoute(
     StatefulRoute[SyncCursorPage[RunStep], PartialSyncCursorPage[PartialRunStep]]
 ):
+    __slots__ = ()
+
     def __init__(self, router: respx.MockRouter, state: StateStore) -> None:
         super().__init__(
             route=router.get(
-                url__regex=r"/threads/(?P<thread_id>[a-zA-Z0-9\_]+)/runs/(?P<run_id>[a-zA-Z0-9\_]+)/steps"
+                url__regex=compile_regex(
+                    r"/threads/(?P<thread_id>[a-zA-Z0-9\_]+)/runs/(?P<run_id>[a-zA-Z0-9\_]+)/steps"
+                )
             ),
             status_code=200,
             state=state,
@@ -43,12 +48,12 @@ class RunStepListRoute(
         thread_id = kwargs["thread_id"]
         found_thread = self._state.beta.threads.get(thread_id)
         if not found_thread:
-            return httpx.Response(404)
+            return NOT_FOUND
 
         run_id = kwargs["run_id"]
         found_run = self._state.beta.threads.runs.get(run_id)
         if not found_run:
-            return httpx.Response(404)
+            return NOT_FOUND
 
         limit = request.url.params.get("limit")
         order = request.url.params.get("order")
@@ -85,10 +90,14 @@ class RunStepListRoute(
 
 
 class RunStepRetrieveRoute(StatefulRoute[RunStep, PartialRunStep]):
+    __slots__ = ()
+
     def __init__(self, router: respx.MockRouter, state: StateStore) -> None:
         super().__init__(
             route=router.get(
-                url__regex=r"/threads/(?P<thread_id>[a-zA-Z0-9\_]+)/runs/(?P<run_id>[a-zA-Z0-9\_]+)/steps/(?P<step_id>[a-zA-Z0-9\_]+)"
+                url__regex=compile_regex(
+                    r"/threads/(?P<thread_id>[a-zA-Z0-9\_]+)/runs/(?P<run_id>[a-zA-Z0-9\_]+)/steps/(?P<step_id>[a-zA-Z0-9\_]+)"
+                )
             ),
             status_code=200,
             state=state,
@@ -106,17 +115,17 @@ class RunStepRetrieveRoute(StatefulRoute[RunStep, PartialRunStep]):
         thread_id = kwargs["thread_id"]
         found_thread = self._state.beta.threads.get(thread_id)
         if not found_thread:
-            return httpx.Response(404)
+            return NOT_FOUND
 
         run_id = kwargs["run_id"]
         found_run = self._state.beta.threads.runs.get(run_id)
         if not found_run:
-            return httpx.Response(404)
+            return NOT_FOUND
 
         step_id = kwargs["step_id"]
         found_run_step = self._state.beta.threads.runs.steps.get(step_id)
         if not found_run_step:
-            return httpx.Response(404)
+            return NOT_FOUND
 
         return httpx.Response(status_code=200, json=model_dict(found_run_step))
 
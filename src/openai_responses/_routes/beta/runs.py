@@ -1,11 +1,13 @@
 import json
-from typing import Any
+from typing import Any, List
 from typing_extensions import override
 
 import httpx
 import respx
 
 from openai.pagination import SyncCursorPage
+from openai.types.beta.assistant import Assistant
+from openai.types.beta.threads.message import Message
 from openai.types.beta.threads.run import Run
 from openai.types.beta.threads.run_create_params import RunCreateParams
 from openai.types.beta.threads.run_update_params import RunUpdateParams
@@ -22,10 +24,17 @@ from ..._types.partials.runs import PartialRun
 
 from ..._utils.copy import model_copy
 from ..._utils.faker import faker
-from ..._utils.serde import json_loads, model_dict, model_parse
+from ..._utils.regex import compile_regex
+from ..._utils.response import NOT_FOUND, json_response
+from ..._utils.serde import (
+    cached_model_dict,
+    json_loads,
+    model_construct,
+    model_dict,
+    model_parse,
+)
 from ..._utils.time import utcnow_unix_timestamp_s
 
-
 __all__ = [
     "RunCreateRoute",
     "ThreadCreateAndRun",
@@ -36,12 +45,26 @@ __all__ = [
     "RunCancelRoute",
 ]
 
+_RunPage = SyncCursorPage[Run]
+
+
+def _partial_run_from_assistant(asst: Assistant) -> PartialRun:
+    """Run defaults inherited from the assistant, built from its cached dump"""
+    deserialized = cached_model_dict(asst)
+    return {
+        "instructions": deserialized["instructions"] or "",
+        "model": deserialized["model"],
+        "tools": deserialized["tools"] or [],
+    }
+
 
 class RunCreateRoute(StatefulRoute[Run, PartialRun]):
+    __slots__ = ()
+
     def __init__(self, router: respx.MockRouter, state: StateStore) -> None:
         super().__init__(
             route=router.post(
-                url__regex=r"/threads/(?P<thread_id>[a-zA-Z0-9\_]+)/runs"
+                url__regex=compile_regex(r"/threads/(?P<thread_id>[a-zA-Z0-9\_]+)/runs")
             ),
             status_code=201,
             state=state,
@@ -59,28 +82,20 @@ class RunCreateRoute(StatefulRoute[Run, PartialRun]):
         thread_id = kwargs["thread_id"]
         found_thread = self._state.beta.threads.get(thread_id)
         if not found_thread:
-            return httpx.Response(404)
+            return NOT_FOUND
 
         content: RunCreateParams = json_loads(request.content)
 
         found_asst = self._state.beta.assistants.get(content["assistant_id"])
         if not found_asst:
-            return httpx.Response(404)
+            return NOT_FOUND
 
         model = self._build(
-            {
-                "thread_id": thread_id,
-                "instructions": found_asst.instructions or "",
-                "model": found_asst.model,
-                "tools": [model_dict(t) for t in (found_asst.tools or [])],  # type: ignore
-            },
+            {"thread_id": thread_id, **_partial_run_from_assistant(found_asst)},
             request,
         )
         self._state.beta.threads.runs.put(model)
-        return httpx.Response(
-            status_code=self._status_code,
-            json=model_dict(model),
-        )
+        return json_response(self._status_code, model_dict(model))
 
     @staticmethod
     def _build(partial: PartialRun, request: httpx.Request) -> Run:
@@ -97,9 +112,11 @@ class RunCreateRoute(StatefulRoute[Run, PartialRun]):
 
 
 class ThreadCreateAndRun(StatefulRoute[Run, PartialRun]):
+    __slots__ = ()
+
     def __init__(self, router: respx.MockRouter, state: StateStore) -> None:
         super().__init__(
-            route=router.post(url__regex="/threads/runs"),
+            route=router.post(url__regex=compile_regex("/threads/runs")),
             status_code=201,
             state=state,
         )
@@ -112,7 +129,7 @@ class ThreadCreateAndRun(StatefulRoute[Run, PartialRun]):
 
         found_asst = self._state.beta.assistants.get(content["assistant_id"])
         if not found_asst:
-            return httpx.Response(404)
+            return NOT_FOUND
 
         thread_create_params = content.get("thread", {})
         encoded = json.dumps(thread_create_params).encode("utf-8")
@@ -120,26 +137,19 @@ class ThreadCreateAndRun(StatefulRoute[Run, PartialRun]):
         thread = thread_from_create_request(thread_create_req)
         self._state.beta.threads.put(thread)
 
+        messages: List[Message] = []
         for message_create_params in thread_create_params.get("messages", []):
             encoded = json.dumps(message_create_params).encode("utf-8")
             create_message_req = httpx.Request(method="", url="", content=encoded)
-            message = message_from_create_request(thread.id, create_message_req)
-            self._state.beta.threads.messages.put(message)
+            messages.append(message_from_create_request(thread.id, create_message_req))
+        self._state.beta.threads.messages.put_many(messages)
 
         model = self._build(
-            {
-                "thread_id": thread.id,
-                "instructions": found_asst.instructions or "",
-                "model": found_asst.model,
-                "tools": [model_dict(t) for t in (found_asst.tools or [])],  # type: ignore
-            },
+            {"thread_id": thread.id, **_partial_run_from_assistant(found_asst)},
             request,
         )
         self._state.beta.threads.runs.put(model)
-        return httpx.Response(
-            status_code=self._status_code,
-            json=model_dict(model),
-        )
+        return json_response(self._status_code, model_dict(model))
 
     @staticmethod
     def _build(partial: PartialRun, request: httpx.Request) -> Run:
@@ -153,9 +163,13 @@ class ThreadCreateAndRun(StatefulRoute[Run, PartialRun]):
 class RunListRoute(
     StatefulRoute[SyncCursorPage[Run], PartialSyncCursorPage[PartialRun]]
 ):
+    __slots__ = ()
+
     def __init__(self, router: respx.MockRouter, state: StateStore) -> None:
         super().__init__(
-            route=router.get(url__regex=r"/threads/(?P<thread_id>[a-zA-Z0-9\_]+)/runs"),
+            route=router.get(
+                url__regex=compile_regex(r"/threads/(?P<thread_id>[a-zA-Z0-9\_]+)/runs")
+            ),
             status_code=200,
             state=state,
         )
@@ -172,7 +186,7 @@ class RunListRoute(
         thread_id = kwargs["thread_id"]
         found_thread = self._state.beta.threads.get(thread_id)
         if not found_thread:
-            return httpx.Response(404)
+            return NOT_FOUND
 
         limit = request.url.params.get("limit")
         order = request.url.params.get("order")
@@ -192,10 +206,10 @@ class RunListRoute(
         has_more = total_count != result_count
         first_id = data[0].id if has_data else None
         last_id = data[-1].id if has_data else None
-        model = SyncCursorPage[Run](data=data)
-        return httpx.Response(
-            status_code=200,
-            json=model_dict(model)
+        model = model_construct(_RunPage, data=data)
+        return json_response(
+            200,
+            model_dict(model)
             | {"first_id": first_id, "last_id": last_id, "has_more": has_more},
         )
 
@@ -208,10 +222,14 @@ class RunListRoute(
 
 
 class RunRetrieveRoute(StatefulRoute[Run, PartialRun]):
+    __slots__ = ()
+
     def __init__(self, router: respx.MockRouter, state: StateStore) -> None:
         super().__init__(
             route=router.get(
-                url__regex=r"/threads/(?P<thread_id>[a-zA-Z0-9\_]+)/runs/(?P<run_id>[a-zA-Z0-9\_]+)"
+                url__regex=compile_regex(
+                    r"/threads/(?P<thread_id>[a-zA-Z0-9\_]+)/runs/(?P<run_id>[a-zA-Z0-9\_]+)"
+                )
             ),
             status_code=200,
             state=state,
@@ -229,14 +247,14 @@ class RunRetrieveRoute(StatefulRoute[Run, PartialRun]):
         thread_id = kwargs["thread_id"]
         found_thread = self._state.beta.threads.get(thread_id)
         if not found_thread:
-            return httpx.Response(404)
+            return NOT_FOUND
 
         run_id = kwargs["run_id"]
         found_run = self._state.beta.threads.runs.get(run_id)
         if not found_run:
-            return httpx.Response(404)
+            return NOT_FOUND
 
-        return httpx.Response(status_code=200, json=model_dict(found_run))
+        return json_response(200, cached_model_dict(found_run))
 
     @staticmethod
     def _build(partial: PartialRun, request: httpx.Request) -> Run:
@@ -244,10 +262,14 @@ class RunRetrieveRoute(StatefulRoute[Run, PartialRun]):
 
 
 class RunUpdateRoute(StatefulRoute[Run, PartialRun]):
+    __slots__ = ()
+
     def __init__(self, router: respx.MockRouter, state: StateStore) -> None:
         super().__init__(
             route=router.post(
-                url__regex=r"/threads/(?P<thread_id>[a-zA-Z0-9\_]+)/runs/(?P<run_id>[a-zA-Z0-9\_]+)"
+                url__regex=compile_regex(
+                    r"/threads/(?P<thread_id>[a-zA-Z0-9\_]+)/runs/(?P<run_id>[a-zA-Z0-9\_]+)"
+                )
             ),
             status_code=200,
             state=state,
@@ -265,19 +287,19 @@ class RunUpdateRoute(StatefulRoute[Run, PartialRun]):
         thread_id = kwargs["thread_id"]
         found_thread = self._state.beta.threads.get(thread_id)
         if not found_thread:
-            return httpx.Response(404)
+            return NOT_FOUND
 
         run_id = kwargs["run_id"]
         found_run = self._state.beta.threads.runs.get(run_id)
         if not found_run:
-            return httpx.Response(404)
+            return NOT_FOUND
 
         content: RunUpdateParams = json_loads(request.content)
         deserialized = model_dict(found_run)
         updated = model_parse(Run, deserialized | content)
         self._state.beta.threads.runs.put(updated)
 
-        return httpx.Response(status_code=200, json=model_dict(updated))
+        return json_response(200, model_dict(updated))
 
     @staticmethod
     def _build(partial: PartialRun, request: httpx.Request) -> Run:
@@ -285,10 +307,14 @@ class RunUpdateRoute(StatefulRoute[Run, PartialRun]):
 
 
 class RunSubmitToolOutputsRoute(StatefulRoute[Run, PartialRun]):
+    __slots__ = ()
+
     def __init__(self, router: respx.MockRouter, state: StateStore) -> None:
         super().__init__(
             route=router.post(
-                url__regex=r"/threads/(?P<thread_id>[a-zA-Z0-9\_]+)/runs/(?P<run_id>[a-zA-Z0-9\_]+)/submit_tool_outputs"
+                url__regex=compile_regex(
+                    r"/threads/(?P<thread_id>[a-zA-Z0-9\_]+)/runs/(?P<run_id>[a-zA-Z0-9\_]+)/submit_tool_outputs"
+                )
             ),
             status_code=200,
             state=state,
@@ -307,14 +333,14 @@ class RunSubmitToolOutputsRoute(StatefulRoute[Run, PartialRun]):
         thread_id = kwargs["thread_id"]
         found_thread = self._state.beta.threads.get(thread_id)
         if not found_thread:
-            return httpx.Response(404)
+            return NOT_FOUND
 
         run_id = kwargs["run_id"]
         found_run = self._state.beta.threads.runs.get(run_id)
         if not found_run:
-            return httpx.Response(404)
+            return NOT_FOUND
 
-        return httpx.Response(status_code=200, json=model_dict(found_run))
+        return json_response(200, model_dict(found_run))
 
     @staticmethod
     def _build(partial: PartialRun, request: httpx.Request) -> Run:
@@ -322,10 +348,14 @@ class RunSubmitToolOutputsRoute(StatefulRoute[Run, PartialRun]):
 
 
 class RunCancelRoute(StatefulRoute[Run, PartialRun]):
+    __slots__ = ()
+
     def __init__(self, router: respx.MockRouter, state: StateStore) -> None:
         super().__init__(
             route=router.post(
-                url__regex=r"/threads/(?P<thread_id>[a-zA-Z0-9\_]+)/runs/(?P<run_id>[a-zA-Z0-9\_]+)/cancel"
+                url__regex=compile_regex(
+                    r"/threads/(?P<thread_id>[a-zA-Z0-9\_]+)/runs/(?P<run_id>[a-zA-Z0-9\_]+)/cancel"
+                )
             ),
             status_code=200,
             state=state,
@@ -344,19 +374,19 @@ class RunCancelRoute(StatefulRoute[Run, PartialRun]):
         thread_id = kwargs["thread_id"]
         found_thread = self._state.beta.threads.get(thread_id)
         if not found_thread:
-            return httpx.Response(404)
+            return NOT_FOUND
 
         run_id = kwargs["run_id"]
         found_run = self._state.beta.threads.runs.get(run_id)
         if not found_run:
-            return httpx.Response(404)
+            return NOT_FOUND
 
         found_run.status = "cancelled"
         self._state.beta.threads.runs.put(found_run)
         copy = model_copy(found_run)
         copy.status = "cancelling"
 
-        return httpx.Response(status_code=200, json=model_dict(copy))
+        return json_response(200, model_dict(copy))
 
     @staticmethod
     def _build(partial: PartialRun, request: httpx.Request) -> Run:
@@ -6,6 +6,7 @@ import httpx
 import respx
 
 from openai.types.beta.thread import Thread
+from openai.types.beta.threads.message import Message
 from openai.types.beta.thread_create_params import ThreadCreateParams
 from openai.types.beta.thread_update_params import ThreadUpdateParams
 from openai.types.beta.thread_deleted import ThreadDeleted
@@ -22,10 +23,11 @@ from ..._types.partials.deleted import PartialResourceDeleted
 from ..._types.partials.threads import PartialThread
 
 from ..._utils.faker import faker
-from ..._utils.serde import json_loads, model_dict, model_parse
+from ..._utils.regex import compile_regex
+from ..._utils.response import NOT_FOUND, json_response
+from ..._utils.serde import cached_model_dict, json_loads, model_dict, model_parse
 from ..._utils.time import utcnow_unix_timestamp_s
 
-
 __all__ = [
     "ThreadCreateRoute",
     "ThreadRetrieveRoute",
@@ -35,9 +37,11 @@ __all__ = [
 
 
 class ThreadCreateRoute(StatefulRoute[Thread, PartialThread]):
+    __slots__ = ()
+
     def __init__(self, router: respx.MockRouter, state: StateStore) -> None:
         super().__init__(
-            route=router.post(url__regex="/threads"),
+            route=router.post(url__regex=compile_regex("/threads")),
             status_code=201,
             state=state,
         )
@@ -50,11 +54,12 @@ class ThreadCreateRoute(StatefulRoute[Thread, PartialThread]):
         model = self._build({}, request)
         self._state.beta.threads.put(model)
 
+        messages: List[Message] = []
         for message_create_params in content.get("messages", []):
             encoded = json.dumps(message_create_params).encode("utf-8")
             create_message_req = httpx.Request(method="", url="", content=encoded)
-            message = message_from_create_request(model.id, create_message_req)
-            self._state.beta.threads.messages.put(message)
+            messages.append(message_from_create_request(model.id, create_message_req))
+        self._state.beta.threads.messages.put_many(messages)
 
         tool_resources = content.get("tool_resources")
         if tool_resources:
@@ -72,7 +77,7 @@ class ThreadCreateRoute(StatefulRoute[Thread, PartialThread]):
                         for file_id in vector_store_create_params.get("file_ids", []):
                             found_file = self._state.files.get(file_id)
                             if not found_file:
-                                return httpx.Response(404)
+                                return NOT_FOUND
                             encoded = json.dumps({"file_id": found_file.id})  # type: ignore
                             create_file_req = httpx.Request("", "", content=encoded)
                             vector_store_file = vector_store_file_from_create_request(
@@ -92,14 +97,11 @@ class ThreadCreateRoute(StatefulRoute[Thread, PartialThread]):
                         },
                     )
 
-        return httpx.Response(
-            status_code=self._status_code,
-            json=model_dict(model),
-        )
+        return json_response(self._status_code, model_dict(model))
 
     @staticmethod
     def _build(partial: PartialThread, request: httpx.Request) -> Thread:
-        content = json.loads(request.content)
+        content = json_loads(request.content)
         if content.get("messages"):
             del content["messages"]
         if content.get("tool_resources"):
@@ -113,9 +115,13 @@ class ThreadCreateRoute(StatefulRoute[Thread, PartialThread]):
 
 
 class ThreadRetrieveRoute(StatefulRoute[Thread, PartialThread]):
+    __slots__ = ()
+
     def __init__(self, router: respx.MockRouter, state: StateStore) -> None:
         super().__init__(
-            route=router.get(url__regex=r"/threads/(?P<thread_id>[a-zA-Z0-9\_]+)"),
+            route=router.get(
+                url__regex=compile_regex(r"/threads/(?P<thread_id>[a-zA-Z0-9\_]+)")
+            ),
             status_code=200,
             state=state,
         )
@@ -131,9 +137,9 @@ class ThreadRetrieveRoute(StatefulRoute[Thread, PartialThread]):
         thread_id = kwargs["thread_id"]
         found = self._state.beta.threads.get(thread_id)
         if not found:
-            return httpx.Response(404)
+            return NOT_FOUND
 
-        return httpx.Response(status_code=200, json=model_dict(found))
+        return json_response(200, cached_model_dict(found))
 
     @staticmethod
     def _build(partial: PartialThread, request: httpx.Request) -> Thread:
@@ -141,10 +147,14 @@ class ThreadRetrieveRoute(StatefulRoute[Thread, PartialThread]):
 
 
 class ThreadUpdateRoute(StatefulRoute[Thread, PartialThread]):
+    __slots__ = ()
+
     def __init__(self, router: respx.MockRouter, state: StateStore) -> None:
         super().__init__(
             route=router.post(
-                url__regex=r"/threads/(?P<thread_id>(?!.*runs)[a-zA-Z0-9_]+)"  # NOTE: avoids match on /threads/runs
+                url__regex=compile_regex(
+                    r"/threads/(?P<thread_id>(?!.*runs)[a-zA-Z0-9_]+)"
+                )  # NOTE: avoids match on /threads/runs
             ),
             status_code=200,
             state=state,
@@ -161,14 +171,14 @@ class ThreadUpdateRoute(StatefulRoute[Thread, PartialThread]):
         thread_id = kwargs["thread_id"]
         found = self._state.beta.threads.get(thread_id)
         if not found:
-            return httpx.Response(404)
+            return NOT_FOUND
 
-        content: ThreadUpdateParams = json.loads(request.content)
+        content: ThreadUpdateParams = json_loads(request.content)
         deserialized = model_dict(found)
         updated = model_parse(Thread, deserialized | content)
         self._state.beta.threads.put(updated)
 
-        return httpx.Response(status_code=200, json=model_dict(updated))
+        return json_response(200, model_dict(updated))
 
     @staticmethod
     def _build(partial: PartialThread, request: httpx.Request) -> Thread:
@@ -178,9 +188,13 @@ class ThreadUpdateRoute(StatefulRoute[Thread, PartialThread]):
 class ThreadDeleteRoute(
     StatefulRoute[ThreadDeleted, PartialResourceDeleted[Literal["thread.deleted"]]]
 ):
+    __slots__ = ()
+
     def __init__(self, router: respx.MockRouter, state: StateStore) -> None:
         super().__init__(
-            route=router.delete(url__regex=r"/threads/(?P<thread_id>[a-zA-Z0-9\_]+)"),
+            route=router.delete(
+                url__regex=compile_regex(r"/threads/(?P<thread_id>[a-zA-Z0-9\_]+)")
+            ),
             status_code=200,
             state=state,
         )
@@ -195,9 +209,9 @@ class ThreadDeleteRoute(
         self._route = route
         thread_id = kwargs["thread_id"]
         deleted = self._state.beta.threads.delete(thread_id)
-        return httpx.Response(
-            status_code=200,
-            json=model_dict(
+        return json_response(
+            200,
+            model_dict(
                 ThreadDeleted(id=thread_id, deleted=deleted, object="thread.deleted")
             ),
         )
@@ -22,7 +22,9 @@ from ..._types.partials.sync_cursor_page import PartialSyncCursorPage
 from ..._types.partials.vector_store_files import PartialVectorStoreFile
 from ..._types.partials.vector_store_file_batches import PartialVectorStoreFileBatch
 
+from ..._utils.response import NOT_FOUND, json_response
 from ..._utils.faker import faker
+from ..._utils.regex import compile_regex
 from ..._utils.serde import json_loads, model_dict, model_parse
 from ..._utils.time import utcnow_unix_timestamp_s
 
@@ -37,10 +39,14 @@ __all__ = [
 class VectorStoreFileBatchCreateRoute(
     StatefulRoute[VectorStoreFileBatch, PartialVectorStoreFileBatch]
 ):
+    __slots__ = ()
+
     def __init__(self, router: respx.MockRouter, state: StateStore) -> None:
         super().__init__(
             route=router.post(
-                url__regex=r"/vector_stores/(?P<vector_store_id>[a-zA-Z0-9\_]+)/file_batches"
+                url__regex=compile_regex(
+                    r"/vector_stores/(?P<vector_store_id>[a-zA-Z0-9\_]+)/file_batches"
+                )
             ),
             status_code=201,
             state=state,
@@ -58,14 +64,14 @@ class VectorStoreFileBatchCreateRoute(
         vector_store_id = kwargs["vector_store_id"]
         found_vector_store = self._state.vector_stores.get(vector_store_id)
         if not found_vector_store:
-            return httpx.Response(404)
+            return NOT_FOUND
 
         model = self._build({"vector_store_id": vector_store_id}, request)
         content: FileBatchCreateParams = json_loads(request.content)
         for file_id in content["file_ids"]:
             found_file = self._state.files.get(file_id)
             if not found_file:
-                return httpx.Response(404)
+                return NOT_FOUND
             encoded = json.dumps({"file_id": found_file.id})
             create_file_req = httpx.Request(method="", url="", content=encoded)
             vector_store_file = vector_store_file_from_create_request(
@@ -106,10 +112,14 @@ class VectorStoreFileBatchCreateRoute(
 class VectorStoreFileBatchRetrieveRoute(
     StatefulRoute[VectorStoreFileBatch, PartialVectorStoreFileBatch]
 ):
+    __slots__ = ()
+
     def __init__(self, router: respx.MockRouter, state: StateStore) -> None:
         super().__init__(
             route=router.get(
-                url__regex=r"/vector_stores/(?P<vector_store_id>[a-zA-Z0-9\_]+)/file_batches/(?P<batch_id>[a-zA-Z0-9\_]+)"
+                url__regex=compile_regex(
+                    r"/vector_stores/(?P<vector_store_id>[a-zA-Z0-9\_]+)/file_batches/(?P<batch_id>[a-zA-Z0-9\_]+)"
+                )
             ),
             status_code=200,
             state=state,
@@ -127,12 +137,12 @@ class VectorStoreFileBatchRetrieveRoute(
         vector_store_id = kwargs["vector_store_id"]
         found_vector_store = self._state.vector_stores.get(vector_store_id)
         if not found_vector_store:
-            return httpx.Response(404)
+            return NOT_FOUND
 
         batch_id = kwargs["batch_id"]
         found = self._state.vector_stores.file_batches.get(batch_id)
         if not found:
-            return httpx.Response(404)
+            return NOT_FOUND
 
         return httpx.Response(status_code=self._status_code, json=model_dict(found))
 
@@ -147,10 +157,14 @@ class VectorStoreFileBatchRetrieveRoute(
 class VectorStoreFileBatchCancelRoute(
     StatefulRoute[VectorStoreFileBatch, PartialVectorStoreFileBatch]
 ):
+    __slots__ = ()
+
     def __init__(self, router: respx.MockRouter, state: StateStore) -> None:
         super().__init__(
             route=router.post(
-                url__regex=r"/vector_stores/(?P<vector_store_id>[a-zA-Z0-9\_]+)/file_batches/(?P<batch_id>[a-zA-Z0-9\_]+)/cancel"
+                url__regex=compile_regex(
+                    r"/vector_stores/(?P<vector_store_id>[a-zA-Z0-9\_]+)/file_batches/(?P<batch_id>[a-zA-Z0-9\_]+)/cancel"
+                )
             ),
             status_code=200,
             state=state,
@@ -168,12 +182,12 @@ class VectorStoreFileBatchCancelRoute(
         vector_store_id = kwargs["vector_store_id"]
         found_vector_store = self._state.vector_stores.get(vector_store_id)
         if not found_vector_store:
-            return httpx.Response(404)
+            return NOT_FOUND
 
         batch_id = kwargs["batch_id"]
         found = self._state.vector_stores.file_batches.get(batch_id)
         if not found:
-            return httpx.Response(404)
+            return NOT_FOUND
 
         found.status = "cancelled"
         self._state.vector_stores.file_batches.put(found)
@@ -193,10 +207,14 @@ class VectorStoreFileBatchListFilesRoute(
         SyncCursorPage[VectorStoreFile], PartialSyncCursorPage[PartialVectorStoreFile]
     ]
 ):
+    __slots__ = ()
+
     def __init__(self, router: respx.MockRouter, state: StateStore) -> None:
         super().__init__(
             route=router.get(
-                url__regex=r"/vector_stores/(?P<vector_store_id>[a-zA-Z0-9\_]+)/file_batches/(?P<batch_id>[a-zA-Z0-9\_]+)/files"
+                url__regex=compile_regex(
+                    r"/vector_stores/(?P<vector_store_id>[a-zA-Z0-9\_]+)/file_batches/(?P<batch_id>[a-zA-Z0-9\_]+)/files"
+                )
             ),
             status_code=200,
             state=state,
@@ -214,12 +232,12 @@ class VectorStoreFileBatchListFilesRoute(
         vector_store_id = kwargs["vector_store_id"]
         found_vector_store = self._state.vector_stores.get(vector_store_id)
         if not found_vector_store:
-            return httpx.Response(404)
+            return NOT_FOUND
 
         batch_id = kwargs["batch_id"]
         found = self._state.vector_stores.file_batches.get(batch_id)
         if not found:
-            return httpx.Response(404)
+            return NOT_FOUND
 
         limit = request.url.params.get("limit")
         order = request.url.params.get("order")
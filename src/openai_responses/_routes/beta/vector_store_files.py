@@ -17,6 +17,8 @@ from ..._types.partials.deleted import PartialResourceDeleted
 from ..._types.partials.sync_cursor_page import PartialSyncCursorPage
 from ..._types.partials.vector_store_files import PartialVectorStoreFile
 
+from ..._utils.response import NOT_FOUND, json_response
+from ..._utils.regex import compile_regex
 from ..._utils.serde import json_loads, model_dict, model_parse
 from ..._utils.time import utcnow_unix_timestamp_s
 
@@ -31,10 +33,14 @@ __all__ = [
 class VectorStoreFileCreateRoute(
     StatefulRoute[VectorStoreFile, PartialVectorStoreFile]
 ):
+    __slots__ = ()
+
     def __init__(self, router: respx.MockRouter, state: StateStore) -> None:
         super().__init__(
             route=router.post(
-                url__regex=r"/vector_stores/(?P<vector_store_id>[a-zA-Z0-9\_]+)/files"
+                url__regex=compile_regex(
+                    r"/vector_stores/(?P<vector_store_id>[a-zA-Z0-9\_]+)/files"
+                )
             ),
             status_code=201,
             state=state,
@@ -52,12 +58,12 @@ class VectorStoreFileCreateRoute(
         vector_store_id = kwargs["vector_store_id"]
         found_vector_store = self._state.vector_stores.get(vector_store_id)
         if not found_vector_store:
-            return httpx.Response(404)
+            return NOT_FOUND
 
         model = self._build({"vector_store_id": vector_store_id}, request)
         found_file = self._state.files.get(model.id)
         if not found_file:
-            return httpx.Response(404)
+            return NOT_FOUND
 
         self._state.vector_stores.files.put(model)
         return httpx.Response(status_code=self._status_code, json=model_dict(model))
@@ -83,10 +89,14 @@ class VectorStoreFileListRoute(
         SyncCursorPage[VectorStoreFile], PartialSyncCursorPage[PartialVectorStoreFile]
     ]
 ):
+    __slots__ = ()
+
     def __init__(self, router: respx.MockRouter, state: StateStore) -> None:
         super().__init__(
             route=router.get(
-                url__regex=r"/vector_stores/(?P<vector_store_id>[a-zA-Z0-9\_]+)/files"
+                url__regex=compile_regex(
+                    r"/vector_stores/(?P<vector_store_id>[a-zA-Z0-9\_]+)/files"
+                )
             ),
             status_code=200,
             state=state,
@@ -104,7 +114,7 @@ class VectorStoreFileListRoute(
         vector_store_id = kwargs["vector_store_id"]
         found_vector_store = self._state.vector_stores.get(vector_store_id)
         if not found_vector_store:
-            return httpx.Response(404)
+            return NOT_FOUND
 
         limit = request.url.params.get("limit")
         order = request.url.params.get("order")
@@ -144,10 +154,14 @@ class VectorStoreFileListRoute(
 class VectorStoreFileRetrieveRoute(
     StatefulRoute[VectorStoreFile, PartialVectorStoreFile]
 ):
+    __slots__ = ()
+
     def __init__(self, router: respx.MockRouter, state: StateStore) -> None:
         super().__init__(
             route=router.get(
-                url__regex=r"/vector_stores/(?P<vector_store_id>[a-zA-Z0-9\_]+)/files/(?P<file_id>[a-zA-Z0-9\-]+)"
+                url__regex=compile_regex(
+                    r"/vector_stores/(?P<vector_store_id>[a-zA-Z0-9\_]+)/files/(?P<file_id>[a-zA-Z0-9\-]+)"
+                )
             ),
             status_code=200,
             state=state,
@@ -164,12 +178,12 @@ class VectorStoreFileRetrieveRoute(
         vector_store_id = kwargs["vector_store_id"]
         found_vector_store = self._state.vector_stores.get(vector_store_id)
         if not found_vector_store:
-            return httpx.Response(404)
+            return NOT_FOUND
 
         file_id = kwargs["file_id"]
         found = self._state.vector_stores.files.get(file_id)
         if not found:
-            return httpx.Response(404)
+            return NOT_FOUND
 
         return httpx.Response(status_code=self._status_code, json=model_dict(found))
 
@@ -187,10 +201,14 @@ class VectorStoreFileDeleteRoute(
         PartialResourceDeleted[Literal["vector_store.file.deleted"]],
     ]
 ):
+    __slots__ = ()
+
     def __init__(self, router: respx.MockRouter, state: StateStore) -> None:
         super().__init__(
             route=router.delete(
-                url__regex=r"/vector_stores/(?P<vector_store_id>[a-zA-Z0-9\_]+)/files/(?P<file_id>[a-zA-Z0-9\-]+)"
+                url__regex=compile_regex(
+                    r"/vector_stores/(?P<vector_store_id>[a-zA-Z0-9\_]+)/files/(?P<file_id>[a-zA-Z0-9\-]+)"
+                )
             ),
             status_code=200,
             state=state,
@@ -207,12 +225,12 @@ class VectorStoreFileDeleteRoute(
         vector_store_id = kwargs["vector_store_id"]
         found_vector_store = self._state.vector_stores.get(vector_store_id)
         if not found_vector_store:
-            return httpx.Response(404)
+            return NOT_FOUND
 
         file_id = kwargs["file_id"]
         found = self._state.vector_stores.files.get(file_id)
         if not found:
-            return httpx.Response(404)
+            return NOT_FOUND
 
         deleted = self._state.vector_stores.files.delete(file_id)
 
@@ -22,7 +22,9 @@ from ..._types.partials.vector_stores import (
     PartialVectorStoreDeleted,
 )
 
+from ..._utils.response import NOT_FOUND, json_response
 from ..._utils.faker import faker
+from ..._utils.regex import compile_regex
 from ..._utils.serde import json_loads, model_dict, model_parse
 from ..._utils.time import utcnow_unix_timestamp_s
 
@@ -36,9 +38,11 @@ __all__ = [
 
 
 class VectorStoreCreateRoute(StatefulRoute[VectorStore, PartialVectorStore]):
+    __slots__ = ()
+
     def __init__(self, router: respx.MockRouter, state: StateStore) -> None:
         super().__init__(
-            route=router.post(url__regex="/vector_stores"),
+            route=router.post(url__regex=compile_regex("/vector_stores")),
             status_code=201,
             state=state,
         )
@@ -53,7 +57,7 @@ class VectorStoreCreateRoute(StatefulRoute[VectorStore, PartialVectorStore]):
         for file_id in file_ids:
             found_file = self._state.files.get(file_id)
             if not found_file:
-                return httpx.Response(404)
+                return NOT_FOUND
             encoded = json.dumps({"file_id": found_file.id})
             create_file_req = httpx.Request(method="", url="", content=encoded)
             vector_store_file = vector_store_file_from_create_request(
@@ -92,9 +96,11 @@ class VectorStoreListRoute(
         SyncCursorPage[VectorStore], PartialSyncCursorPage[PartialVectorStore]
     ]
 ):
+    __slots__ = ()
+
     def __init__(self, router: respx.MockRouter, state: StateStore) -> None:
         super().__init__(
-            route=router.get(url__regex="/vector_stores"),
+            route=router.get(url__regex=compile_regex("/vector_stores")),
             status_code=200,
             state=state,
         )
@@ -131,10 +137,14 @@ class VectorStoreListRoute(
 
 
 class VectorStoreRetrieveRoute(StatefulRoute[VectorStore, PartialVectorStore]):
+    __slots__ = ()
+
     def __init__(self, router: respx.MockRouter, state: StateStore) -> None:
         super().__init__(
             route=router.get(
-                url__regex=r"/vector_stores/(?P<vector_store_id>[a-zA-Z0-9\_]+)"
+                url__regex=compile_regex(
+                    r"/vector_stores/(?P<vector_store_id>[a-zA-Z0-9\_]+)"
+                )
             ),
             status_code=200,
             state=state,
@@ -151,7 +161,7 @@ class VectorStoreRetrieveRoute(StatefulRoute[VectorStore, PartialVectorStore]):
         vector_store_id = kwargs["vector_store_id"]
         found = self._state.vector_stores.get(vector_store_id)
         if not found:
-            return httpx.Response(404)
+            return NOT_FOUND
 
         return httpx.Response(status_code=self._status_code, json=model_dict(found))
 
@@ -161,10 +171,14 @@ class VectorStoreRetrieveRoute(StatefulRoute[VectorStore, PartialVectorStore]):
 
 
 class VectorStoreUpdateRoute(StatefulRoute[VectorStore, PartialVectorStore]):
+    __slots__ = ()
+
     def __init__(self, router: respx.MockRouter, state: StateStore) -> None:
         super().__init__(
             route=router.post(
-                url__regex=r"/vector_stores/(?P<vector_store_id>[a-zA-Z0-9\_]+)"
+                url__regex=compile_regex(
+                    r"/vector_stores/(?P<vector_store_id>[a-zA-Z0-9\_]+)"
+                )
             ),
             status_code=200,
             state=state,
@@ -181,7 +195,7 @@ class VectorStoreUpdateRoute(StatefulRoute[VectorStore, PartialVectorStore]):
         vector_store_id = kwargs["vector_store_id"]
         found = self._state.vector_stores.get(vector_store_id)
         if not found:
-            return httpx.Response(404)
+            return NOT_FOUND
 
         content: VectorStoreUpdateParams = json_loads(request.content)
         deserialized = model_dict(found)
@@ -196,10 +210,14 @@ class VectorStoreUpdateRoute(StatefulRoute[VectorStore, PartialVectorStore]):
 class VectorStoreDeleteRoute(
     StatefulRoute[VectorStoreDeleted, PartialVectorStoreDeleted]
 ):
+    __slots__ = ()
+
     def __init__(self, router: respx.MockRouter, state: StateStore) -> None:
         super().__init__(
             route=router.delete(
-                url__regex=r"/vector_stores/(?P<vector_store_id>[a-zA-Z0-9\_]+)"
+                url__regex=compile_regex(
+                    r"/vector_stores/(?P<vector_store_id>[a-zA-Z0-9\_]+)"
+                )
             ),
             status_code=200,
             state=state,
@@ -9,6 +9,7 @@ from ._base import StatelessRoute
 
 from .._types.partials.embeddings import PartialCreateEmbeddingResponse
 
+from .._utils.regex import compile_regex
 from .._utils.serde import json_loads, model_parse
 
 __all__ = ["EmbeddingsCreateRoute"]
@@ -20,9 +21,11 @@ class EmbeddingsCreateRoute(
         PartialCreateEmbeddingResponse,
     ]
 ):
+    __slots__ = ()
+
     def __init__(self, router: respx.MockRouter) -> None:
         super().__init__(
-            route=router.post(url__regex="/embeddings"),
+            route=router.post(url__regex=compile_regex("/embeddings")),
             status_code=201,
         )
 
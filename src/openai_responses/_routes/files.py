@@ -19,18 +19,21 @@ from .._types.partials.files import (
     PartialFileDeleted,
 )
 
+from .._utils.response import NOT_FOUND, json_response
 from .._utils.faker import faker
+from .._utils.regex import compile_regex
 from .._utils.serde import model_dict
 from .._utils.time import utcnow_unix_timestamp_s
 
-
 __all__ = ["FileCreateRoute", "FileListRoute", "FileRetrieveRoute", "FileDeleteRoute"]
 
 
 class FileCreateRoute(StatefulRoute[FileObject, PartialFileObject]):
+    __slots__ = ()
+
     def __init__(self, router: respx.MockRouter, state: StateStore) -> None:
         super().__init__(
-            route=router.post(url__regex="/files"),
+            route=router.post(url__regex=compile_regex("/files")),
             status_code=201,
             state=state,
         )
@@ -86,9 +89,11 @@ class FileCreateRoute(StatefulRoute[FileObject, PartialFileObject]):
 
 
 class FileListRoute(StatefulRoute[SyncPage[FileObject], PartialFileList]):
+    __slots__ = ()
+
     def __init__(self, router: respx.MockRouter, state: StateStore) -> None:
         super().__init__(
-            route=router.get(url__regex="/files"),
+            route=router.get(url__regex=compile_regex("/files")),
             status_code=200,
             state=state,
         )
@@ -112,9 +117,13 @@ class FileListRoute(StatefulRoute[SyncPage[FileObject], PartialFileList]):
 
 
 class FileRetrieveRoute(StatefulRoute[FileObject, PartialFileObject]):
+    __slots__ = ()
+
     def __init__(self, router: respx.MockRouter, state: StateStore) -> None:
         super().__init__(
-            route=router.get(url__regex=r"/files/(?P<file_id>[a-zA-Z0-9\-]+)"),
+            route=router.get(
+                url__regex=compile_regex(r"/files/(?P<file_id>[a-zA-Z0-9\-]+)")
+            ),
             status_code=200,
             state=state,
         )
@@ -130,7 +139,7 @@ class FileRetrieveRoute(StatefulRoute[FileObject, PartialFileObject]):
         fil_id = kwargs["file_id"]
         found = self._state.files.get(fil_id)
         if not found:
-            return httpx.Response(404)
+            return NOT_FOUND
 
         return httpx.Response(status_code=200, json=model_dict(found))
 
@@ -143,9 +152,13 @@ class FileRetrieveRoute(StatefulRoute[FileObject, PartialFileObject]):
 
 
 class FileDeleteRoute(StatefulRoute[FileObject, PartialFileDeleted]):
+    __slots__ = ()
+
     def __init__(self, router: respx.MockRouter, state: StateStore) -> None:
         super().__init__(
-            route=router.delete(url__regex=r"/files/(?P<file_id>[a-zA-Z0-9\-]+)"),
+            route=router.delete(
+                url__regex=compile_regex(r"/files/(?P<file_id>[a-zA-Z0-9\-]+)")
+            ),
             status_code=200,
             state=state,
         )
@@ -174,9 +187,13 @@ class FileDeleteRoute(StatefulRoute[FileObject, PartialFileDeleted]):
 
 
 class FileRetrieveContentRoute(StatefulRoute[FileObject, PartialFileObject]):
+    __slots__ = ()
+
     def __init__(self, router: respx.MockRouter, state: StateStore) -> None:
         super().__init__(
-            route=router.get(url__regex=r"/files/(?P<file_id>[a-zA-Z0-9\-]+)/content"),
+            route=router.get(
+                url__regex=compile_regex(r"/files/(?P<file_id>[a-zA-Z0-9\-]+)/content")
+            ),
             status_code=200,
             state=state,
         )
@@ -192,7 +209,7 @@ class FileRetrieveContentRoute(StatefulRoute[FileObject, PartialFileObject]):
         fil_id = kwargs["file_id"]
         found = self._state.files.get(fil_id)
         if not found:
-            return httpx.Response(404)
+            return NOT_FOUND
 
         content = self._state.files.content.get(found.id)
         assert content
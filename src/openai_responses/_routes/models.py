@@ -13,15 +13,19 @@ from ..stores import StateStore
 from .._types.partials.models import PartialModel
 from .._types.partials.sync_cursor_page import PartialSyncCursorPage
 
+from .._utils.response import NOT_FOUND, json_response
+from .._utils.regex import compile_regex
 from .._utils.serde import model_dict
 
 
 class ModelListRoute(
     StatefulRoute[SyncCursorPage[Model], PartialSyncCursorPage[PartialModel]]
 ):
+    __slots__ = ()
+
     def __init__(self, router: respx.MockRouter, state: StateStore) -> None:
         super().__init__(
-            route=router.get(url__regex="/models"),
+            route=router.get(url__regex=compile_regex("/models")),
             status_code=200,
             state=state,
         )
@@ -42,9 +46,11 @@ class ModelListRoute(
 
 
 class ModelRetrieveRoute(StatefulRoute[Model, PartialModel]):
+    __slots__ = ()
+
     def __init__(self, router: respx.MockRouter, state: StateStore) -> None:
         super().__init__(
-            route=router.get(url__regex=r"/models/(?P<model_id>.+)"),
+            route=router.get(url__regex=compile_regex(r"/models/(?P<model_id>.+)")),
             status_code=200,
             state=state,
         )
@@ -60,7 +66,7 @@ class ModelRetrieveRoute(StatefulRoute[Model, PartialModel]):
         model_id = kwargs["model_id"]
         found = self._state.models.get(model_id)
         if not found:
-            return httpx.Response(404)
+            return NOT_FOUND
 
         return httpx.Response(status_code=200, json=model_dict(found), request=request)
 
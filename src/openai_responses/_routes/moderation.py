@@ -18,8 +18,9 @@ from .._types.partials.moderation import (
     PartialCategoryAppliedInputTypes,
 )
 
-from .._utils.serde import model_parse
 from .._utils.faker import faker
+from .._utils.regex import compile_regex
+from .._utils.serde import model_parse
 
 __all__ = ["ModerationCreateRoute"]
 
@@ -75,8 +76,12 @@ _default_category_applied_input_types: PartialCategoryAppliedInputTypes = {
 class ModerationCreateRoute(
     StatelessRoute[ModerationCreateResponse, PartialModerationCreateResponse]
 ):
+    __slots__ = ()
+
     def __init__(self, router: respx.MockRouter) -> None:
-        super().__init__(route=router.post(url__regex="/moderations"), status_code=200)
+        super().__init__(
+            route=router.post(url__regex=compile_regex("/moderations")), status_code=200
+        )
 
     @staticmethod
     def _build(
@@ -19,9 +19,24 @@ class Base62:
 base62 = Base62()
 
 
+_SUFFIX_LENGTH = 24
+_POOL_SIZE = 256
+
+_suffix_pool: list[str] = []
+
+
+def _refill_suffix_pool() -> None:
+    b = random.randbytes(_SUFFIX_LENGTH * _POOL_SIZE)
+    _suffix_pool.extend(
+        base62.encode(b[i : i + _SUFFIX_LENGTH])
+        for i in range(0, len(b), _SUFFIX_LENGTH)
+    )
+
+
 def gen_id_suffix() -> str:
-    b = random.randbytes(24)
-    return base62.encode(b)
+    if not _suffix_pool:
+        _refill_suffix_pool()
+    return _suffix_pool.pop()
 
 
 def gen_id(prefix: str, *, sep: str = "_") -> str:
@@ -0,0 +1,14 @@
+import re
+from functools import lru_cache
+
+__all__ = ["compile_regex"]
+
+
+@lru_cache(maxsize=None)
+def compile_regex(pattern: str) -> "re.Pattern[str]":
+    """Compile and memoize a route regex.
+
+    Route patterns are static but route objects are rebuilt for every mock
+    construction, so caching avoids recompiling the same patterns repeatedly.
+    """
+    return re.compile(pattern)
@@ -0,0 +1,27 @@
+from typing import Any
+
+import httpx
+
+from .serde import json_dumps
+
+__all__ = ["NOT_FOUND", "json_response"]
+
+_JSON_HEADERS = {"content-type": "application/json"}
+
+NOT_FOUND = httpx.Response(404)
+"""Shared empty 404 returned on every lookup miss; safe to reuse since
+handlers never mutate it"""
+
+
+def json_response(status_code: int, data: Any) -> httpx.Response:
+    """Build a JSON response from pre-serialized bytes.
+
+    `httpx.Response(json=...)` runs its own `json.dumps` pass; serializing
+    up front with `json_dumps` avoids that second encode on every mocked
+    response.
+    """
+    return httpx.Response(
+        status_code=status_code,
+        content=json_dumps(data),
+        headers=_JSON_HEADERS,
+    )
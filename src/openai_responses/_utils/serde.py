@@ -1,18 +1,38 @@
 import json
-from typing import Any, Type
+import weakref
+from typing import Any, Dict, Tuple, Type
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
 
 from openai import BaseModel
 
 from .._types.generics import M
 
-__all__ = ["json_loads", "model_dict", "model_parse"]
+__all__ = [
+    "cached_model_dict",
+    "evict_cached_model_dict",
+    "json_dumps",
+    "json_loads",
+    "model_construct",
+    "model_dict",
+    "model_parse",
+]
 
 
 def json_loads(b: bytes) -> Any:
-    d = json.loads(b)
+    d = orjson.loads(b) if orjson is not None else json.loads(b)
     return {k: v for k, v in d.items() if v is not None}
 
 
+def json_dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
 def model_dict(m: BaseModel, **kwargs: Any) -> dict[str, Any]:
     if hasattr(m, "model_dump"):
         return getattr(m, "model_dump")(**kwargs)
@@ -20,8 +40,54 @@ def model_dict(m: BaseModel, **kwargs: Any) -> dict[str, Any]:
         return getattr(m, "dict")(**kwargs)
 
 
+_dump_cache: Dict[int, Tuple["weakref.ref[BaseModel]", Dict[str, Any]]] = {}
+
+
+def cached_model_dict(m: BaseModel) -> Dict[str, Any]:
+    """Serialize like `model_dict` but memoize the result per live object.
+
+    Intended for retrieve paths that repeatedly serialize the same stored,
+    unchanged model (e.g. polling a run until its status changes). Stores
+    evict on `put`, so callers that mutate a stored model must put it back
+    for subsequent retrieves to observe the change. Pydantic v1 models are
+    not weakref-able, so they skip the cache and serialize every time.
+    """
+    key = id(m)
+    hit = _dump_cache.get(key)
+    if hit is not None and hit[0]() is m:
+        return hit[1]
+    d = model_dict(m)
+
+    def _evict(_: "weakref.ref[BaseModel]", key: int = key) -> None:
+        _dump_cache.pop(key, None)
+
+    try:
+        ref = weakref.ref(m, _evict)
+    except TypeError:
+        return d
+    _dump_cache[key] = (ref, d)
+    return d
+
+
+def evict_cached_model_dict(m: BaseModel) -> None:
+    _dump_cache.pop(id(m), None)
+
+
 def model_parse(m: Type[M], d: object, **kwargs: Any) -> M:
     if hasattr(m, "model_validate"):
         return getattr(m, "model_validate")(d, **kwargs)
     else:
         return getattr(m, "parse_obj")(d, **kwargs)
+
+
+def model_construct(m: Type[M], **fields: Any) -> M:
+    """Build a model without validation.
+
+    Only for internally-produced values whose shape is already known to be
+    valid (e.g. wrapping already-validated models in a page); anything
+    derived from request content must go through `model_parse`.
+    """
+    if hasattr(m, "model_construct"):
+        return getattr(m, "model_construct")(**fields)
+    else:
+        return getattr(m, "construct")(**fields)
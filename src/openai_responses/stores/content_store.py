@@ -2,6 +2,8 @@ from typing import Dict, Union
 
 
 class ContentStore:
+    __slots__ = ("_data",)
+
     def __init__(self) -> None:
         self._data: Dict[str, bytes] = {}
 
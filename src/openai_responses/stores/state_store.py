@@ -1,4 +1,14 @@
-from typing import Any, Dict, Generic, List, Literal, Optional, TypeVar, Union
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    TypeVar,
+    Union,
+)
 
 from openai.types import FileObject, Model
 
@@ -14,7 +24,7 @@ from openai.types.vector_stores.vector_store_file_batch import VectorStoreFileBa
 
 from .content_store import ContentStore
 from .._constants import SYSTEM_MODELS
-from .._utils.serde import model_parse
+from .._utils.serde import evict_cached_model_dict, model_construct
 
 __all__ = ["StateStore"]
 
@@ -36,6 +46,8 @@ M = TypeVar("M", bound=AnyModel)
 
 
 class StateStore:
+    __slots__ = ("files", "models", "vector_stores", "beta")
+
     def __init__(self) -> None:
         self.files = FileStore()
         self.models = ModelStore()
@@ -68,18 +80,27 @@ class StateStore:
 
 
 class Beta:
+    __slots__ = ("assistants", "threads")
+
     def __init__(self) -> None:
         self.assistants = AssistantStore()
         self.threads = ThreadStore()
 
 
 class BaseStore(Generic[M]):
+    __slots__ = ("_data",)
+
     def __init__(self) -> None:
         self._data: Dict[str, M] = {}
 
     def put(self, obj: M) -> None:
+        evict_cached_model_dict(obj)
         self._data[obj.id] = obj
 
+    def put_many(self, objs: Iterable[M]) -> None:
+        for obj in objs:
+            self.put(obj)
+
     def get(self, id: str) -> Optional[M]:
         return self._data.get(id)
 
@@ -92,6 +113,8 @@ class BaseStore(Generic[M]):
 
 
 class FileStore(BaseStore[FileObject]):
+    __slots__ = ("content",)
+
     def __init__(self) -> None:
         super().__init__()
         self.content = ContentStore()
@@ -114,16 +137,20 @@ class FileStore(BaseStore[FileObject]):
 
 
 class ModelStore(BaseStore[Model]):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__()
         for model in SYSTEM_MODELS:
-            self._data[str(model["id"])] = model_parse(Model, model)
+            self._data[str(model["id"])] = model_construct(Model, **model)
 
     def list(self) -> List[Model]:
         return list(self._data.values())
 
 
 class AssistantStore(BaseStore[Assistant]):
+    __slots__ = ()
+
     def list(
         self,
         limit: Optional[str] = None,
@@ -152,6 +179,8 @@ class AssistantStore(BaseStore[Assistant]):
 
 
 class ThreadStore(BaseStore[Thread]):
+    __slots__ = ("messages", "runs")
+
     def __init__(self) -> None:
         super().__init__()
         self.messages = MessageStore()
@@ -159,6 +188,34 @@ class ThreadStore(BaseStore[Thread]):
 
 
 class MessageStore(BaseStore[Message]):
+    __slots__ = ("_by_thread",)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._by_thread: Dict[str, List[str]] = {}
+
+    def put(self, obj: Message) -> None:
+        if obj.id not in self._data:
+            self._by_thread.setdefault(obj.thread_id, []).append(obj.id)
+        super().put(obj)
+
+    def put_many(self, objs: Iterable[Message]) -> None:
+        messages = list(objs)
+        new_by_thread: Dict[str, List[str]] = {}
+        for obj in messages:
+            evict_cached_model_dict(obj)
+            if obj.id not in self._data:
+                new_by_thread.setdefault(obj.thread_id, []).append(obj.id)
+        self._data.update((obj.id, obj) for obj in messages)
+        for thread_id, ids in new_by_thread.items():
+            self._by_thread.setdefault(thread_id, []).extend(ids)
+
+    def delete(self, id: str) -> bool:
+        obj = self._data.get(id)
+        if obj:
+            self._by_thread[obj.thread_id].remove(id)
+        return super().delete(id)
+
     def list(
         self,
         thread_id: str,
@@ -169,31 +226,41 @@ class MessageStore(BaseStore[Message]):
         run_id: Optional[str] = None,
     ) -> List[Message]:
         limit = limit or "20"
-        objs = [m for m in list(self._data.values()) if m.thread_id == thread_id]
+        ids = self._by_thread.get(thread_id, [])
         if run_id:
-            objs = [obj for obj in objs if obj.run_id == run_id]
-        objs = list(reversed(objs)) if (order or "desc") == "desc" else objs
+            ids = [i for i in ids if self._data[i].run_id == run_id]
+        ids = list(reversed(ids)) if (order or "desc") == "desc" else list(ids)
 
         start_ix = 0
-        if after:
-            obj = self._data.get(after)
-            if obj:
-                start_ix = objs.index(obj) + 1
+        if after and after in self._data:
+            start_ix = ids.index(after) + 1
 
         end_ix = None
-        if before:
-            obj = self._data.get(before)
-            if obj:
-                end_ix = objs.index(obj)
+        if before and before in self._data:
+            end_ix = ids.index(before)
 
-        objs = objs[start_ix:end_ix]
-        return objs[: int(limit)]
+        ids = ids[start_ix:end_ix]
+        return [self._data[i] for i in ids[: int(limit)]]
 
 
 class RunStore(BaseStore[Run]):
+    __slots__ = ("steps", "_by_thread")
+
     def __init__(self) -> None:
         super().__init__()
         self.steps = RunStepStore()
+        self._by_thread: Dict[str, List[str]] = {}
+
+    def put(self, obj: Run) -> None:
+        if obj.id not in self._data:
+            self._by_thread.setdefault(obj.thread_id, []).append(obj.id)
+        super().put(obj)
+
+    def delete(self, id: str) -> bool:
+        obj = self._data.get(id)
+        if obj:
+            self._by_thread[obj.thread_id].remove(id)
+        return super().delete(id)
 
     def list(
         self,
@@ -204,26 +271,24 @@ class RunStore(BaseStore[Run]):
         before: Optional[str] = None,
     ) -> List[Run]:
         limit = limit or "20"
-        objs = [m for m in list(self._data.values()) if m.thread_id == thread_id]
-        objs = list(reversed(objs)) if (order or "desc") == "desc" else objs
+        ids = self._by_thread.get(thread_id, [])
+        ids = list(reversed(ids)) if (order or "desc") == "desc" else list(ids)
 
         start_ix = 0
-        if after:
-            obj = self._data.get(after)
-            if obj:
-                start_ix = objs.index(obj) + 1
+        if after and after in self._data:
+            start_ix = ids.index(after) + 1
 
         end_ix = None
-        if before:
-            obj = self._data.get(before)
-            if obj:
-                end_ix = objs.index(obj)
+        if before and before in self._data:
+            end_ix = ids.index(before)
 
-        objs = objs[start_ix:end_ix]
-        return objs[: int(limit)]
+        ids = ids[start_ix:end_ix]
+        return [self._data[i] for i in ids[: int(limit)]]
 
 
 class RunStepStore(BaseStore[RunStep]):
+    __slots__ = ()
+
     def list(
         self,
         thread_id: str,
@@ -258,6 +323,8 @@ class RunStepStore(BaseStore[RunStep]):
 
 
 class VectorStoreStore(BaseStore[VectorStore]):
+    __slots__ = ("files", "file_batches")
+
     def __init__(self) -> None:
         super().__init__()
         self.files = VectorStoreFileStore()
@@ -328,6 +395,8 @@ class VectorStoreStore(BaseStore[VectorStore]):
 
 
 class VectorStoreFileStore(BaseStore[VectorStoreFile]):
+    __slots__ = ()
+
     def list(
         self,
         vector_store_id: str,
@@ -364,6 +433,8 @@ class VectorStoreFileStore(BaseStore[VectorStoreFile]):
 
 
 class VectorStoreFileBatchStore(BaseStore[VectorStoreFileBatch]):
+    __slots__ = ("_related_files",)
+
     def __init__(self) -> None:
         super().__init__()
         self._related_files: Dict[str, List[str]] = {}
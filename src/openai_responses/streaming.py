@@ -12,7 +12,6 @@ from typing import (
 from openai.types.beta import AssistantStreamEvent
 from openai.types.chat import ChatCompletionChunk
 
-from ._utils.aio import make_async_generator
 from ._utils.serde import model_dict
 
 __all__ = ["EventStream", "AsyncEventStream"]
@@ -22,16 +21,17 @@ M = TypeVar("M", bound=Union[AssistantStreamEvent, ChatCompletionChunk])
 
 class BaseEventStream(Generic[M]):
     @staticmethod
-    def _dump_event(event: M) -> tuple[Optional[bytes], Optional[bytes]]:
+    def _dump_event(event: M) -> bytes:
+        """Serialize an event to a single SSE frame so each event is one write"""
         if hasattr(event, "event") and hasattr(event, "data"):
             event_type: Optional[str] = getattr(event, "event", None)
             data: Optional[AssistantStreamEvent] = getattr(event, "data", None)
             if event_type is not None and data is not None:
-                encoded_event = f"event: {event_type}\n".encode()
-                encoded_data = f"data: {json.dumps(model_dict(data))}\n\n".encode()
-                return encoded_event, encoded_data
-        encoded_data = f"data: {json.dumps(model_dict(event))}\n\n".encode()
-        return None, encoded_data
+                return (
+                    f"event: {event_type}\n"
+                    f"data: {json.dumps(model_dict(data))}\n\n".encode()
+                )
+        return f"data: {json.dumps(model_dict(event))}\n\n".encode()
 
 
 class EventStream(BaseEventStream[M]):
@@ -39,14 +39,9 @@ class EventStream(BaseEventStream[M]):
 
     def __iter__(self) -> Generator[bytes, None, None]:
         for _event in self.generate():
-            t, d = self._dump_event(_event)
-            if t:
-                yield t
-            if d:
-                yield d
+            yield self._dump_event(_event)
 
-        yield b"event: done\n"
-        yield b"data: [DONE]\n\n"
+        yield b"event: done\ndata: [DONE]\n\n"
 
     def generate(self) -> Generator[M, None, None]:
         raise NotImplementedError
@@ -57,13 +52,8 @@ class AsyncEventStream(BaseEventStream[M]):
 
     async def __aiter__(self) -> AsyncIterator[bytes]:
         async for _event in self.agenerate():
-            t, d = self._dump_event(_event)
-            if t:
-                yield t
-            if d:
-                yield d
-        yield b"event: done\n"
-        yield b"data: [DONE]\n\n"
+            yield self._dump_event(_event)
+        yield b"event: done\ndata: [DONE]\n\n"
 
     def agenerate(self) -> AsyncGenerator[M, None]:
         raise NotImplementedError
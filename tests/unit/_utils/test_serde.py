@@ -0,0 +1,23 @@
+from openai.types.beta.thread import Thread
+
+from openai_responses._utils.serde import (
+    cached_model_dict,
+    evict_cached_model_dict,
+    model_dict,
+)
+
+
+def test_cached_model_dict_returns_same_dump_for_unchanged_model():
+    thread = Thread(id="thread_abc123", created_at=0, object="thread")
+    first = cached_model_dict(thread)
+    second = cached_model_dict(thread)
+    assert first is second
+    assert first == model_dict(thread)
+
+
+def test_cached_model_dict_eviction_observes_mutation():
+    thread = Thread(id="thread_abc123", created_at=0, object="thread")
+    assert cached_model_dict(thread)["metadata"] is None
+    thread.metadata = {"foo": "bar"}
+    evict_cached_model_dict(thread)
+    assert cached_model_dict(thread)["metadata"] == {"foo": "bar"}
@@ -161,6 +161,29 @@ def test_message_store(state_store: StateStore):
     assert messages[-1].id == "msg_20"
 
 
+def test_message_store_put_many(state_store: StateStore):
+    state_store.beta.threads.messages.put_many(
+        Message(
+            id=f"msg_{i}",
+            content=[],
+            created_at=0,
+            object="thread.message",
+            role="user",
+            status="completed",
+            thread_id="thread_abc123",
+        )
+        for i in range(10)
+    )
+
+    messages = state_store.beta.threads.messages.list(
+        thread_id="thread_abc123",
+        order="asc",
+    )
+    assert len(messages) == 10
+    assert messages[0].id == "msg_0"
+    assert messages[-1].id == "msg_9"
+
+
 def test_run_store(state_store: StateStore):
     obj = Run(
         id="run_abc123",